@@ -4,31 +4,151 @@ Build script for TikTok Live Watcher executable
 Creates a complete distribution with all dependencies
 """
 
+import argparse
+import collections
 import os
 import shutil
+import stat
 import subprocess
 import sys
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def run_command(cmd, cwd=None):
-    """Run a command and return success status"""
+# Host platform, queried once
+SYSTEM = platform.system()
+MACHINE = platform.machine()
+IS_WINDOWS = SYSTEM == "Windows"
+
+# Use a 1 MiB buffer for every shutil copy (default is 64 KiB). The executable is
+# tens of MB, so fewer, larger syscalls win; the extra RAM is only 1 MiB per copy.
+shutil.COPY_BUFSIZE = 1024 * 1024
+
+def run_command(cmd, cwd=None, env=None):
+    """Run a command, streaming its output, and return success status
+
+    cmd is an argument list, run directly without a shell.
+    Only the last lines of output are kept, to repeat them if the command fails.
+    """
     try:
-        result = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"Error running: {cmd}")
-            print(f"Output: {result.stdout}")
-            print(f"Error: {result.stderr}")
+        proc = subprocess.Popen(cmd, cwd=cwd, env=env,
+                                stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                text=True, bufsize=1)
+        tail = collections.deque(maxlen=200)
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            tail.append(line)
+
+        if proc.wait() != 0:
+            print(f"Error running: {subprocess.list2cmdline(cmd)}")
+            print("".join(tail))
             return False
         return True
     except Exception as e:
-        print(f"Exception running {cmd}: {e}")
+        print(f"Exception running {subprocess.list2cmdline(cmd)}: {e}")
+        return False
+
+def _force_remove(func, path, _exc):
+    """rmtree error handler: clear a read-only flag (PyInstaller leaves some on Windows) and retry"""
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+def _rmtree(path):
+    """shutil.rmtree that also removes read-only files"""
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_force_remove)
+    else:
+        shutil.rmtree(path, onerror=_force_remove)
+
+def _write_file(path, data):
+    """Write generated text (str or UTF-8 bytes) with a single write() call"""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    with open(path, "wb", buffering=1 << 20) as f:
+        f.write(data)
+
+def venv_environment(venv_dir="venv"):
+    """Return (python, env) for running tools inside the venv without a shell activation"""
+    venv_abs = Path(venv_dir).resolve()
+    bin_dir = venv_abs / ("Scripts" if IS_WINDOWS else "bin")
+    venv_python = bin_dir / ("python.exe" if IS_WINDOWS else "python")
+
+    # Activation only sets these two variables
+    env = {
+        **os.environ,
+        "VIRTUAL_ENV": str(venv_abs),
+        "PATH": str(bin_dir) + os.pathsep + os.environ.get("PATH", ""),
+    }
+    return str(venv_python), env
+
+def _clonefile(src, dst):
+    """Clone src to dst with macOS clonefile(2) - an instant copy-on-write copy on APFS"""
+    import ctypes
+    libc = ctypes.CDLL(None, use_errno=True)
+    # clonefile refuses to overwrite
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), dst)
+
+def _copy_file_range(src_fd, dst_fd, size):
+    """Copy with copy_file_range (reflinks on btrfs/XFS); False if unsupported here"""
+    if not hasattr(os, "copy_file_range"):
+        return False
+    offset = 0
+    try:
+        while offset < size:
+            copied = os.copy_file_range(src_fd, dst_fd, size - offset, offset, offset)
+            if copied == 0:
+                break
+            offset += copied
+    except OSError:
+        # EXDEV/ENOSYS/EOPNOTSUPP before anything was copied - let the caller fall back
+        if offset:
+            raise
         return False
+    return True
+
+def _fast_copy(src, dst):
+    """Copy a file in-kernel where possible, preserving metadata like shutil.copy2"""
+    src, dst = str(src), str(dst)
+
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            if not ctypes.windll.kernel32.CopyFileW(src, dst, False):
+                raise ctypes.WinError()
+        elif sys.platform == "darwin":
+            try:
+                _clonefile(src, dst)
+            except OSError:
+                # Not APFS (or cross-volume) - copy the data in-kernel instead
+                import posix
+                with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                    posix._fcopyfile(fsrc.fileno(), fdst.fileno(), posix._COPYFILE_DATA)
+        else:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                size = os.fstat(fsrc.fileno()).st_size
+                if not _copy_file_range(fsrc.fileno(), fdst.fileno(), size):
+                    # sendfile moves the bytes without bouncing them through Python
+                    offset = 0
+                    while offset < size:
+                        sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+    except (OSError, AttributeError):
+        # Syscall unavailable or refused - fall back to a large-buffer userspace copy
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            shutil.copyfileobj(fsrc, fdst, length=shutil.COPY_BUFSIZE)
+
+    shutil.copystat(src, dst)
 
 def download_ffmpeg_binary():
     """Download platform-specific ffmpeg binary"""
-    system = platform.system().lower()
-    arch = platform.machine().lower()
+    system = SYSTEM.lower()
+    arch = MACHINE.lower()
 
     print(f"Detected platform: {system} {arch}")
 
@@ -57,9 +177,7 @@ def download_ffmpeg_binary():
 
     return False
 
-def create_spec_file():
-    """Create a custom PyInstaller spec file"""
-    spec_content = """
+SPEC_TEMPLATE = """
 # -*- mode: python ; coding: utf-8 -*-
 
 block_cipher = None
@@ -75,6 +193,7 @@ a = Analysis(
     hiddenimports=[
         'managers.username_manager',
         'managers.settings_manager',
+        'managers.storage',
         'checkers.tiktok_checker',
         'recorders.stream_recorder',
         'ui.menu',
@@ -102,7 +221,7 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    upx=%(upx)s,
     upx_exclude=[],
     runtime_tmpdir=None,
     console=True,
@@ -112,50 +231,48 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
 )
-"""
+""".strip().encode("utf-8")
 
-    with open("TikTok-Live-Watcher.spec", "w") as f:
-        f.write(spec_content.strip())
+def create_spec_file(upx=False):
+    """Create a custom PyInstaller spec file
+
+    UPX is off by default: it slows the build and decompresses the executable on
+    every launch. Enable it only when on-disk size matters more than startup time.
+    """
+    spec_content = SPEC_TEMPLATE % {b"upx": b"True" if upx else b"False"}
+
+    # Leave an identical spec untouched so its mtime doesn't invalidate PyInstaller's cache
+    spec_path = Path("TikTok-Live-Watcher.spec")
+    if spec_path.exists() and spec_path.read_bytes() == spec_content:
+        print("Spec file unchanged")
+        return
+
+    _write_file(spec_path, spec_content)
 
     print("Created custom spec file")
 
-def build_executable():
+def build_executable(clean=False):
     """Build the executable using PyInstaller"""
     print("Building executable...")
 
-    # Clean previous builds
-    if os.path.exists("build"):
-        shutil.rmtree("build")
-    if os.path.exists("dist"):
-        shutil.rmtree("dist")
+    # build/ is PyInstaller's incremental cache - only wipe it when asked
+    targets = {"build", "dist"} if clean else {"dist"}
+    with os.scandir(".") as it:
+        to_remove = [e.path for e in it if e.name in targets and e.is_dir(follow_symlinks=False)]
+
+    # Independent subtrees, so remove them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(_rmtree, to_remove))
 
-    # Build with custom spec
-    if not run_command("pyinstaller TikTok-Live-Watcher.spec"):
+    # Build with custom spec, using the venv's interpreter directly (no shell activation)
+    venv_python, env = venv_environment()
+    if not run_command([venv_python, "-m", "PyInstaller", "TikTok-Live-Watcher.spec"], env=env):
         return False
 
     print("Executable built successfully")
     return True
 
-def create_distribution_package():
-    """Create a complete distribution package"""
-    print("Creating distribution package...")
-
-    # Create distribution directory
-    dist_name = f"TikTok-Live-Watcher-{platform.system()}-{platform.machine()}"
-    dist_dir = Path(f"dist/{dist_name}")
-    dist_dir.mkdir(parents=True, exist_ok=True)
-
-    # Copy executable
-    exe_name = "TikTok-Live-Watcher"
-    if platform.system() == "Windows":
-        exe_name += ".exe"
-
-    src_exe = Path(f"dist/{exe_name}")
-    if src_exe.exists():
-        shutil.copy2(src_exe, dist_dir / exe_name)
-
-    # Create README for distribution
-    readme_content = f"""# TikTok Live Watcher - Portable Distribution
+DIST_README_TEMPLATE = """# TikTok Live Watcher - Portable Distribution
 
 ## Quick Start
 
@@ -170,7 +287,7 @@ def create_distribution_package():
    ```
 
 3. **Run the application**:
-   - Double-click `{exe_name}` or run from terminal
+   - Double-click `%(exe_name)s` or run from terminal
 
 ## Notes
 
@@ -189,13 +306,9 @@ If recording doesn't work:
 ## Support
 
 For issues, visit: https://github.com/mladejovskyy/tiktok-live-watcher
-"""
+""".encode("utf-8")
 
-    with open(dist_dir / "README.txt", "w") as f:
-        f.write(readme_content)
-
-    # Create install script for dependencies
-    install_script = """#!/bin/bash
+INSTALL_SCRIPT_SH = """#!/bin/bash
 # Install dependencies for TikTok Live Watcher
 
 echo "Installing TikTok Live Watcher dependencies..."
@@ -223,16 +336,10 @@ fi
 
 echo "Setup complete!"
 echo "You can now run the TikTok Live Watcher executable."
-"""
+""".encode("utf-8")
 
-    with open(dist_dir / "install_dependencies.sh", "w") as f:
-        f.write(install_script)
-
-    # Make install script executable
-    os.chmod(dist_dir / "install_dependencies.sh", 0o755)
-
-    # Create Windows batch file
-    install_bat = """@echo off
+# Batch files keep CRLF line endings for cmd.exe
+INSTALL_SCRIPT_BAT = """@echo off
 echo Installing TikTok Live Watcher dependencies...
 
 REM Check if pip is available
@@ -259,16 +366,50 @@ if errorlevel 1 (
 echo Setup complete!
 echo You can now run the TikTok Live Watcher executable.
 pause
-"""
+""".replace("\n", "\r\n").encode("utf-8")
 
-    with open(dist_dir / "install_dependencies.bat", "w") as f:
-        f.write(install_bat)
+def create_distribution_package():
+    """Create a complete distribution package"""
+    print("Creating distribution package...")
+
+    # Create distribution directory
+    dist_name = f"TikTok-Live-Watcher-{SYSTEM}-{MACHINE}"
+    dist_dir = Path(f"dist/{dist_name}")
+    dist_dir.mkdir(parents=True, exist_ok=True)
+
+    # Copy executable
+    exe_name = "TikTok-Live-Watcher"
+    if IS_WINDOWS:
+        exe_name += ".exe"
+
+    src_exe = Path(f"dist/{exe_name}")
+    if src_exe.exists():
+        _fast_copy(src_exe, dist_dir / exe_name)
+
+    # Create README for distribution
+    _write_file(dist_dir / "README.txt", DIST_README_TEMPLATE % {b"exe_name": exe_name.encode("utf-8")})
+
+    # Create install script for dependencies
+    _write_file(dist_dir / "install_dependencies.sh", INSTALL_SCRIPT_SH)
+
+    # Make install script executable
+    os.chmod(dist_dir / "install_dependencies.sh", 0o755)
+
+    # Create Windows batch file
+    _write_file(dist_dir / "install_dependencies.bat", INSTALL_SCRIPT_BAT)
 
     print(f"Distribution package created: {dist_dir}")
     return str(dist_dir)
 
 def main():
     """Main build process"""
+    parser = argparse.ArgumentParser(description="Build the TikTok Live Watcher executable")
+    parser.add_argument("--clean", "--fresh", action="store_true",
+                        help="wipe the PyInstaller build cache before building")
+    parser.add_argument("--release", action="store_true",
+                        help="compress the executable with UPX (smaller file, slower build and startup)")
+    args = parser.parse_args()
+
     print("Building TikTok Live Watcher Executable")
     print("=" * 50)
 
@@ -284,17 +425,10 @@ def main():
     print("PyInstaller already installed")
 
     # Create spec file
-    create_spec_file()
+    create_spec_file(upx=args.release)
 
     # Build executable
-    # Use Windows-compatible activation
-    activation_cmd = "venv\\Scripts\\activate.bat && pyinstaller TikTok-Live-Watcher.spec"
-    if platform.system() == "Windows":
-        activation_cmd = "venv\\Scripts\\activate.bat && pyinstaller TikTok-Live-Watcher.spec"
-    else:
-        activation_cmd = "source venv/bin/activate && pyinstaller TikTok-Live-Watcher.spec"
-
-    if not run_command(activation_cmd):
+    if not build_executable(clean=args.clean):
         print("Failed to build executable")
         return 1
 
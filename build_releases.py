@@ -5,35 +5,168 @@ Release builder for TikTok Live Watcher
 Creates ready-to-run executables for Windows and macOS users
 """
 
+import argparse
+import collections
+import hashlib
+import mmap
 import os
 import shutil
+import stat
 import subprocess
 import sys
+import tempfile
 import platform
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import xxhash  # Optional: ~3x faster content hashing for the release manifest
+except ImportError:
+    xxhash = None
+
+# Host platform, queried once
+SYSTEM = platform.system()
+MACHINE = platform.machine()
+IS_WINDOWS = SYSTEM == "Windows"
+
+# Larger shutil copy buffer (64 KiB default); costs 1 MiB of RAM per active copy
+shutil.COPY_BUFSIZE = 1024 * 1024
+
+# Release files worth deflating; everything else (the executable) is stored
+TEXT_SUFFIXES = (".txt", ".md", ".sh", ".bat")
+
+# Files above this size are written into the zip from an mmap in a single call
+MMAP_THRESHOLD = 4 * 1024 * 1024
+
 # Fix encoding issues on Windows
-if platform.system() == "Windows":
+if IS_WINDOWS:
     import io
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
-def run_command(cmd, cwd=None):
-    """Run a command and return success status"""
+def run_command(cmd, cwd=None, env=None):
+    """Run a command, streaming its output, and return success status
+
+    cmd is an argument list, run directly without a shell.
+    Only the last lines of output are kept, to repeat them if the command fails.
+    """
     try:
-        result = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"❌ Error running: {cmd}")
-            print(f"Output: {result.stdout}")
-            print(f"Error: {result.stderr}")
+        proc = subprocess.Popen(cmd, cwd=cwd, env=env,
+                                stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                text=True, bufsize=1)
+        tail = collections.deque(maxlen=200)
+        for line in proc.stdout:
+            sys.stdout.write(line)
+            tail.append(line)
+
+        if proc.wait() != 0:
+            print(f"❌ Error running: {subprocess.list2cmdline(cmd)}")
+            print("".join(tail))
             return False
-        print(f"✅ Success: {cmd}")
+        print(f"✅ Success: {subprocess.list2cmdline(cmd)}")
         return True
     except Exception as e:
-        print(f"❌ Exception running {cmd}: {e}")
+        print(f"❌ Exception running {subprocess.list2cmdline(cmd)}: {e}")
         return False
 
+def _force_remove(func, path, _exc):
+    """rmtree error handler: clear a read-only flag (PyInstaller leaves some on Windows) and retry"""
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+def _rmtree(path):
+    """shutil.rmtree that also removes read-only files"""
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_force_remove)
+    else:
+        shutil.rmtree(path, onerror=_force_remove)
+
+def _write_file(path, data):
+    """Write generated text (str or UTF-8 bytes) with a single write() call"""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    with open(path, "wb", buffering=1 << 20) as f:
+        f.write(data)
+
+def venv_environment(venv_dir="venv"):
+    """Return (python, env) for running tools inside the venv without a shell activation"""
+    venv_abs = Path(venv_dir).resolve()
+    bin_dir = venv_abs / ("Scripts" if IS_WINDOWS else "bin")
+    venv_python = bin_dir / ("python.exe" if IS_WINDOWS else "python")
+
+    # Activation only sets these two variables
+    env = {
+        **os.environ,
+        "VIRTUAL_ENV": str(venv_abs),
+        "PATH": str(bin_dir) + os.pathsep + os.environ.get("PATH", ""),
+    }
+    return str(venv_python), env
+
+def _clonefile(src, dst):
+    """Clone src to dst with macOS clonefile(2) - an instant copy-on-write copy on APFS"""
+    import ctypes
+    libc = ctypes.CDLL(None, use_errno=True)
+    # clonefile refuses to overwrite
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), dst)
+
+def _copy_file_range(src_fd, dst_fd, size):
+    """Copy with copy_file_range (reflinks on btrfs/XFS); False if unsupported here"""
+    if not hasattr(os, "copy_file_range"):
+        return False
+    offset = 0
+    try:
+        while offset < size:
+            copied = os.copy_file_range(src_fd, dst_fd, size - offset, offset, offset)
+            if copied == 0:
+                break
+            offset += copied
+    except OSError:
+        # EXDEV/ENOSYS/EOPNOTSUPP before anything was copied - let the caller fall back
+        if offset:
+            raise
+        return False
+    return True
+
+def _fast_copy(src, dst):
+    """Copy a file in-kernel where possible, preserving metadata like shutil.copy2"""
+    src, dst = str(src), str(dst)
+
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            if not ctypes.windll.kernel32.CopyFileW(src, dst, False):
+                raise ctypes.WinError()
+        elif sys.platform == "darwin":
+            try:
+                _clonefile(src, dst)
+            except OSError:
+                # Not APFS (or cross-volume) - copy the data in-kernel instead
+                import posix
+                with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                    posix._fcopyfile(fsrc.fileno(), fdst.fileno(), posix._COPYFILE_DATA)
+        else:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                size = os.fstat(fsrc.fileno()).st_size
+                if not _copy_file_range(fsrc.fileno(), fdst.fileno(), size):
+                    # sendfile moves the bytes without bouncing them through Python
+                    offset = 0
+                    while offset < size:
+                        sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+    except (OSError, AttributeError):
+        # Syscall unavailable or refused - fall back to a large-buffer userspace copy
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            shutil.copyfileobj(fsrc, fdst, length=shutil.COPY_BUFSIZE)
+
+    shutil.copystat(src, dst)
+
 def prepare_ffmpeg_for_bundle():
     """Download ffmpeg for bundling with the executable"""
     try:
@@ -89,11 +222,19 @@ def prepare_ffmpeg_for_bundle():
         print(f"⚠️  Could not prepare ffmpeg: {e}")
         return None
 
-def clean_build_artifacts():
-    """Clean previous build artifacts"""
+def clean_build_artifacts(clean=False):
+    """Clean previous build artifacts
+
+    dist/ is always removed. The PyInstaller work directories (build/ and the
+    pyinst-* temp dirs) are its incremental analysis cache and the spec is
+    reused by builds with the same flags, so they are kept unless clean is True.
+    """
     print("🧹 Cleaning previous builds...")
 
-    for item in ["build", "dist", "*.spec"]:
+    items = ["build", "dist", "*.spec"] if clean else ["dist"]
+    if clean:
+        items.extend(str(p) for p in Path(tempfile.gettempdir()).glob("pyinst-*"))
+    for item in items:
         if item.endswith("*.spec"):
             for spec_file in Path(".").glob("*.spec"):
                 spec_file.unlink()
@@ -102,13 +243,26 @@ def clean_build_artifacts():
             path = Path(item)
             if path.exists():
                 if path.is_dir():
-                    shutil.rmtree(path)
+                    _rmtree(path)
                 else:
                     path.unlink()
                 print(f"   Removed {path}")
 
-def build_executable(app_name="TikTok-Live-Watcher"):
-    """Build the executable using PyInstaller"""
+def _file_sha256(path):
+    """Hex sha256 of a small file's contents"""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+def pyinstaller_workpath(pyinstaller_args):
+    """Return the temp-dir PyInstaller work path for this set of build flags"""
+    digest = hashlib.md5("\0".join(pyinstaller_args).encode("utf-8")).hexdigest()[:8]
+    return Path(tempfile.gettempdir()) / f"pyinst-{digest}"
+
+def build_executable(app_name="TikTok-Live-Watcher", upx=False):
+    """Build the executable using PyInstaller
+
+    UPX compression is skipped unless upx is True - it costs build time and
+    decompression on every launch, and the release zip compresses anyway.
+    """
     print(f"🔨 Building {app_name} executable...")
 
     # Download and prepare ffmpeg
@@ -122,6 +276,7 @@ def build_executable(app_name="TikTok-Live-Watcher"):
         "--add-data", "README.md:.",
         "--hidden-import", "managers.username_manager",
         "--hidden-import", "managers.settings_manager",
+        "--hidden-import", "managers.storage",
         "--hidden-import", "checkers.tiktok_checker",
         "--hidden-import", "recorders.stream_recorder",
         "--hidden-import", "ui.menu",
@@ -129,9 +284,12 @@ def build_executable(app_name="TikTok-Live-Watcher"):
         "main.py"
     ]
 
+    if not upx:
+        cmd.insert(1, "--noupx")
+
     # Add ffmpeg to bundle if available
     if ffmpeg_path and os.path.exists(ffmpeg_path):
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             cmd.extend(["--add-binary", f"{ffmpeg_path};."])
         else:
             cmd.extend(["--add-binary", f"{ffmpeg_path}:."])
@@ -140,56 +298,48 @@ def build_executable(app_name="TikTok-Live-Watcher"):
         print("❌ CRITICAL: ffmpeg not found - build will fail!")
         return False
 
-    # Activate virtual environment and run PyInstaller
-    venv_python = "venv/bin/python" if platform.system() != "Windows" else "venv\\Scripts\\python.exe"
-    venv_pip = "venv/bin/pip" if platform.system() != "Windows" else "venv\\Scripts\\pip.exe"
+    # Run inside the virtual environment without spawning a shell to activate it
+    venv_python, env = venv_environment()
 
     # Install PyInstaller in venv
-    if not run_command(f"{venv_pip} install pyinstaller"):
+    if not run_command([venv_python, "-m", "pip", "install", "pyinstaller"], env=env):
         return False
 
-    # Run PyInstaller
-    full_cmd = f"{venv_python} -m PyInstaller " + " ".join(f'"{arg}"' if " " in arg else arg for arg in cmd[1:])
+    # Keep PyInstaller's thousands of intermediate files in the temp dir (tmpfs on
+    # most Linux setups), keyed by the build flags so the cache survives reruns
+    pyinstaller_args = cmd[1:]
+    workpath = pyinstaller_workpath(pyinstaller_args)
+    common_args = ["--noconfirm", "--workpath", str(workpath), "--distpath", "dist"]
+
+    # Rebuild from the spec generated by the last run with these same flags, so
+    # PyInstaller reuses its analysis instead of regenerating the spec
+    spec_path = Path(f"{app_name}.spec")
+    spec_stamp = workpath / "spec.sha256"
+    if spec_stamp.exists() and spec_path.exists() and spec_stamp.read_text() == _file_sha256(spec_path):
+        print(f"   Reusing {spec_path}")
+        pyinstaller_args = common_args + [str(spec_path)]
+    else:
+        spec_stamp.unlink(missing_ok=True)
+        pyinstaller_args = common_args + pyinstaller_args
 
-    if not run_command(full_cmd):
+    # Run PyInstaller, streaming its output
+    if not run_command([venv_python, "-m", "PyInstaller"] + pyinstaller_args, env=env):
         return False
 
+    _write_file(spec_stamp, _file_sha256(spec_path))
     return True
 
-def create_user_package(platform_name):
-    """Create a complete package for end users"""
-    print(f"📦 Creating user package for {platform_name}...")
-
-    # Determine executable extension
-    exe_extension = ".exe" if platform_name == "Windows" else ""
-    exe_name = f"TikTok-Live-Watcher{exe_extension}"
-
-    # Create package directory
-    package_name = f"TikTok-Live-Watcher-{platform_name}"
-    package_dir = Path("releases") / package_name
-    package_dir.mkdir(parents=True, exist_ok=True)
-
-    # Copy executable
-    src_exe = Path("dist") / exe_name
-    if not src_exe.exists():
-        print(f"❌ Executable not found: {src_exe}")
-        return None
-
-    shutil.copy2(src_exe, package_dir / exe_name)
-    print(f"   ✅ Copied executable: {exe_name}")
-
-    # Create user-friendly README
-    readme_content = f"""# TikTok Live Watcher - {platform_name}
+README_TEMPLATE = """# TikTok Live Watcher - %(platform_name)s
 
 ## 🚀 Quick Start
 
 ### Step 1: Install Dependencies (One-time setup)
 Run the setup script to install required tools:
 
-{"**Windows:** Double-click `setup.bat`" if platform_name == "Windows" else "**macOS/Linux:** Run `./setup.sh` in Terminal"}
+%(setup_hint)s
 
 ### Step 2: Run the App
-{"**Windows:** Double-click `TikTok-Live-Watcher.exe`" if platform_name == "Windows" else f"**{platform_name}:** Double-click `TikTok-Live-Watcher` or run `./TikTok-Live-Watcher` in Terminal"}
+%(run_hint)s
 
 ## 📋 What the Setup Script Does
 
@@ -201,7 +351,7 @@ The setup script installs:
 
 1. **Add usernames** - Add TikTok usernames you want to monitor (without @)
 2. **Enable recording** - Toggle recording on/off (menu option 4)
-3. **Start monitoring** - Select a username to monitor
+3. **Start monitoring** - Select one or more usernames (or all) to monitor at the same time
 4. **Recording** - When enabled, streams are automatically saved to `Recordings/` folder
 
 ## 🔧 Troubleshooting
@@ -213,7 +363,7 @@ The setup script installs:
 
 ### Can't find executable?
 - Make sure you're running the correct file for your system
-- {"On Windows: TikTok-Live-Watcher.exe" if platform_name == "Windows" else f"On {platform_name}: TikTok-Live-Watcher (no extension)"}
+- %(exe_hint)s
 
 ## 📁 Files Created
 
@@ -228,22 +378,72 @@ All files are created in the same folder as the executable:
 ## 🆘 Support
 
 For help: https://github.com/mladejovskyy/tiktok-live-watcher/issues
-"""
+""".encode("utf-8")
+
+def _unix_readme_substitutions(platform_name):
+    """README placeholders for a macOS/Linux package"""
+    return {
+        b"platform_name": platform_name.encode("utf-8"),
+        b"setup_hint": b"**macOS/Linux:** Run `./setup.sh` in Terminal",
+        b"run_hint": f"**{platform_name}:** Double-click `TikTok-Live-Watcher` or run `./TikTok-Live-Watcher` in Terminal".encode("utf-8"),
+        b"exe_hint": f"On {platform_name}: TikTok-Live-Watcher (no extension)".encode("utf-8"),
+    }
+
+# Per-platform README placeholders, built once
+README_SUBSTITUTIONS = {
+    "Windows": {
+        b"platform_name": b"Windows",
+        b"setup_hint": b"**Windows:** Double-click `setup.bat`",
+        b"run_hint": b"**Windows:** Double-click `TikTok-Live-Watcher.exe`",
+        b"exe_hint": b"On Windows: TikTok-Live-Watcher.exe",
+    },
+    "macOS": _unix_readme_substitutions("macOS"),
+    "Linux": _unix_readme_substitutions("Linux"),
+}
 
-    with open(package_dir / "README.txt", "w", encoding="utf-8") as f:
-        f.write(readme_content)
+def create_user_package(platform_name):
+    """Create a complete package for end users"""
+    print(f"📦 Creating user package for {platform_name}...")
 
-    # Create setup scripts
-    if platform_name == "Windows":
-        create_windows_setup(package_dir)
-    else:
-        create_unix_setup(package_dir, platform_name)
+    # Determine executable extension
+    exe_extension = ".exe" if platform_name == "Windows" else ""
+    exe_name = f"TikTok-Live-Watcher{exe_extension}"
+
+    # Create package directory
+    package_name = f"TikTok-Live-Watcher-{platform_name}"
+    package_dir = Path("releases") / package_name
+    package_dir.mkdir(parents=True, exist_ok=True)
+
+    # Copy executable
+    src_exe = Path("dist") / exe_name
+    if not src_exe.exists():
+        print(f"❌ Executable not found: {src_exe}")
+        return None
+
+    # Create user-friendly README
+    readme_content = README_TEMPLATE % README_SUBSTITUTIONS[platform_name]
+
+    # The executable copy dominates; write README and setup script alongside it
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(_fast_copy, src_exe, package_dir / exe_name),
+            executor.submit(_write_file, package_dir / "README.txt", readme_content),
+        ]
+        if platform_name == "Windows":
+            futures.append(executor.submit(create_windows_setup, package_dir))
+        else:
+            futures.append(executor.submit(create_unix_setup, package_dir, platform_name))
+
+        # Re-raise any failure from the workers
+        for future in futures:
+            future.result()
+
+    print(f"   ✅ Copied executable: {exe_name}")
 
     return package_dir
 
-def create_windows_setup(package_dir):
-    """Create Windows setup script"""
-    setup_script = """@echo off
+# cmd.exe mis-parses goto labels in LF-only batch files, so keep CRLF line endings
+WINDOWS_SETUP_SCRIPT = """@echo off
 echo ========================================
 echo TikTok Live Watcher - Windows Setup
 echo ========================================
@@ -494,24 +694,15 @@ echo.
 echo Debug: Script reached end unexpectedly
 echo Press Enter to close...
 pause
-"""
-
-    with open(package_dir / "setup.bat", "w", encoding="utf-8") as f:
-        f.write(setup_script)
-
-def create_unix_setup(package_dir, platform_name):
-    """Create Unix (macOS/Linux) setup script"""
+""".replace("\n", "\r\n").encode("utf-8")
 
-    if platform_name == "macOS":
-        ffmpeg_install = "brew install ffmpeg"
-        python_install = "Download from https://python.org or use: brew install python"
-    else:  # Linux
-        ffmpeg_install = "sudo apt install ffmpeg  # or: sudo yum install ffmpeg"
-        python_install = "sudo apt install python3 python3-pip  # or: sudo yum install python3 python3-pip"
+def create_windows_setup(package_dir):
+    """Create Windows setup script"""
+    _write_file(package_dir / "setup.bat", WINDOWS_SETUP_SCRIPT)
 
-    setup_script = f"""#!/bin/bash
+UNIX_SETUP_TEMPLATE = """#!/bin/bash
 echo "========================================"
-echo "TikTok Live Watcher - {platform_name} Setup"
+echo "TikTok Live Watcher - %(platform_name)s Setup"
 echo "========================================"
 echo
 
@@ -520,7 +711,7 @@ if ! command -v python3 &> /dev/null; then
     echo "❌ Python3 not found!"
     echo
     echo "Please install Python3:"
-    echo "  {python_install}"
+    echo "  %(python_install)s"
     echo
     exit 1
 fi
@@ -566,7 +757,7 @@ if ! command -v ffmpeg &> /dev/null; then
     echo "⚠️  ffmpeg not found!"
     echo
     echo "Please install ffmpeg:"
-    echo "  {ffmpeg_install}"
+    echo "  %(ffmpeg_install)s"
     echo
     echo "After installing ffmpeg, you can use the app."
 else
@@ -580,44 +771,143 @@ echo "========================================"
 echo
 echo "You can now run: ./TikTok-Live-Watcher"
 echo
-"""
+""".encode("utf-8")
+
+# Per-platform setup.sh placeholders, built once
+UNIX_SETUP_SUBSTITUTIONS = {
+    "macOS": {
+        b"platform_name": b"macOS",
+        b"python_install": b"Download from https://python.org or use: brew install python",
+        b"ffmpeg_install": b"brew install ffmpeg",
+    },
+    "Linux": {
+        b"platform_name": b"Linux",
+        b"python_install": b"sudo apt install python3 python3-pip  # or: sudo yum install python3 python3-pip",
+        b"ffmpeg_install": b"sudo apt install ffmpeg  # or: sudo yum install ffmpeg",
+    },
+}
 
+def create_unix_setup(package_dir, platform_name):
+    """Create Unix (macOS/Linux) setup script"""
     script_path = package_dir / "setup.sh"
-    with open(script_path, "w", encoding="utf-8") as f:
-        f.write(setup_script)
+    substitutions = UNIX_SETUP_SUBSTITUTIONS.get(platform_name, UNIX_SETUP_SUBSTITUTIONS["Linux"])
+    _write_file(script_path, UNIX_SETUP_TEMPLATE % substitutions)
 
     # Make script executable
     os.chmod(script_path, 0o755)
 
+def _walk_files(directory):
+    """Yield a DirEntry for every file under directory
+
+    DirEntry.is_dir/is_file use the type cached from the directory listing, so
+    unlike rglob + is_file this needs no extra stat per entry.
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+def _write_mmapped_entry(zipf, file_path, arcname):
+    """Write a large file into the zip as one stored entry straight from an mmap"""
+    # from_file keeps the mtime and permission bits (executable flag) like zipf.write
+    zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+    zinfo.compress_type = zipfile.ZIP_STORED
+
+    with zipf.open(zinfo, "w", force_zip64=True) as entry, open(file_path, "rb") as src:
+        mm = mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            entry.write(mm)
+        finally:
+            mm.close()
+
+def _file_digest(path):
+    """Hash one file's contents (xxh3 if available, otherwise sha256)"""
+    with open(path, "rb") as f:
+        if xxhash is not None:
+            h = xxhash.xxh3_64()
+        elif hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        else:
+            h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(shutil.COPY_BUFSIZE), b""):
+            h.update(chunk)
+        return h.hexdigest()
+
+def package_manifest_digest(package_dir):
+    """Digest of every file's relative name, size and content in the package"""
+    manifest = hashlib.sha256()
+    entries = sorted(_walk_files(package_dir), key=lambda e: e.path)
+    for entry in entries:
+        name = Path(entry.path).relative_to(package_dir).as_posix()
+        manifest.update(f"{name}\0{entry.stat().st_size}\0{_file_digest(entry.path)}\n".encode("utf-8"))
+    return manifest.hexdigest()
+
 def create_zip_release(package_dir):
     """Create a zip file for easy distribution"""
     zip_path = f"{package_dir}.zip"
 
-    print(f"📦 Creating zip release: {zip_path}")
+    # Skip the rebuild when the package contents match the ones the existing zip was made
+    # from. The sidecar holds that manifest digest, not a checksum of the zip itself.
+    digest_path = Path(f"{zip_path}.manifest.sha256")
+    digest = package_manifest_digest(package_dir)
+    if Path(zip_path).exists() and digest_path.exists() and digest_path.read_text().strip() == digest:
+        print(f"✅ Zip up-to-date: {zip_path}")
+        return zip_path
 
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for file_path in package_dir.rglob('*'):
-            if file_path.is_file():
-                # Calculate the path relative to the package directory
-                arcname = file_path.relative_to(package_dir.parent)
+    print(f"📦 Creating zip release: {zip_path}")
+    digest_path.unlink(missing_ok=True)
+
+    # The executable is already compressed, so it is stored as-is; only the
+    # small text files are deflated (level 1 - higher levels gain nothing here)
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as zipf:
+        for entry in _walk_files(package_dir):
+            file_path = Path(entry.path)
+            # Calculate the path relative to the package directory
+            arcname = file_path.relative_to(package_dir.parent)
+            if file_path.suffix in TEXT_SUFFIXES:
+                zipf.write(file_path, arcname, compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
+            elif entry.stat().st_size > MMAP_THRESHOLD:
+                _write_mmapped_entry(zipf, file_path, arcname)
+            else:
                 zipf.write(file_path, arcname)
 
+    _write_file(digest_path, digest + "\n")
+
     print(f"✅ Created: {zip_path}")
     return zip_path
 
+def _build_platform_package(platform_name):
+    """Package one platform's executable and archive it
+
+    Returns (package_dir, zip_path), or None if packaging failed.
+    """
+    package_dir = create_user_package(platform_name)
+    if not package_dir:
+        return None
+    return package_dir, create_zip_release(package_dir)
+
 def main():
     """Main release build process"""
+    parser = argparse.ArgumentParser(description="Build a TikTok Live Watcher release")
+    parser.add_argument("--clean", "--fresh", action="store_true",
+                        help="wipe the PyInstaller build cache and spec before building")
+    parser.add_argument("--release", action="store_true",
+                        help="compress the executable with UPX (smaller file, slower build and startup)")
+    args = parser.parse_args()
+
     print("🚀 TikTok Live Watcher Release Builder")
     print("=" * 50)
 
     # Clean previous builds
-    clean_build_artifacts()
+    clean_build_artifacts(clean=args.clean)
 
     # Create releases directory
     Path("releases").mkdir(exist_ok=True)
 
     # Detect current platform
-    current_platform = platform.system()
+    current_platform = SYSTEM
     if current_platform == "Darwin":
         platform_name = "macOS"
     elif current_platform == "Windows":
@@ -628,19 +918,17 @@ def main():
     print(f"🖥️  Building for: {platform_name}")
 
     # Build executable
-    if not build_executable():
+    if not build_executable(upx=args.release):
         print("❌ Failed to build executable")
         return 1
 
-    # Create user package
-    package_dir = create_user_package(platform_name)
-    if not package_dir:
+    # Only the host platform's executable is ever built, so there is one package
+    result = _build_platform_package(platform_name)
+    if result is None:
         print("❌ Failed to create user package")
         return 1
 
-    # Create zip release
-    zip_path = create_zip_release(package_dir)
-
+    package_dir, zip_path = result
     print("\n🎉 RELEASE BUILD COMPLETE!")
     print("=" * 50)
     print(f"📁 Package folder: {package_dir}")
@@ -1,53 +1,166 @@
 import asyncio
+import importlib.util
+import logging
 import random
-from typing import Optional
+import time
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
 
-from TikTokLive import TikTokLiveClient
-from TikTokLive.client.logger import LogLevel
+from managers.username_manager import VALID_USERNAME
+
+if TYPE_CHECKING:
+    from TikTokLive import TikTokLiveClient
+
+# Seconds before a single is_live request is abandoned
+REQUEST_TIMEOUT = 15.0
+
+# Seconds a positive is_live answer is trusted by get_stream_url
+LIVE_CACHE_TTL = 5.0
+
+# Most live checks check_many runs at the same time
+MAX_CONCURRENT_CHECKS = 10
 
 
 class TikTokLiveChecker:
     """Checks TikTok live status using TikTokLive library."""
 
     def __init__(self):
+        # One client per username, reused across polls so its HTTP session stays warm
+        self._clients: Dict[str, "TikTokLiveClient"] = {}
+
+        # Last is_live answer per username: (monotonic timestamp, is_live)
+        self._live_cache: Dict[str, Tuple[float, bool]] = {}
+
+        self._check_slots = asyncio.Semaphore(MAX_CONCURRENT_CHECKS)
+
+        # Set to cut the monitor's wait short and re-check every user right away
+        self.wake = asyncio.Event()
+
+        # TikTokLive and httpx are imported on first use so the menu starts instantly
+        self._client_cls = None
+        self._transport = None
+        self._retryable_errors: tuple = ()
+        self._offline_errors: tuple = ()
+        self._final_errors: tuple = ()
+
+    def load_backend(self) -> None:
+        """Import TikTokLive and create the shared connection pool (once)."""
+        if self._client_cls is not None:
+            return
+
+        import httpx
+        from TikTokLive import TikTokLiveClient
+        from TikTokLive.client.errors import (
+            AgeRestrictedError, SignAPIError, UserNotFoundError, UserOfflineError
+        )
+
         # Disable logging for cleaner output
-        import logging
         logging.getLogger('TikTokLive').setLevel(logging.CRITICAL)
 
+        self._client_cls = TikTokLiveClient
+
+        # Failures worth retrying (network trouble, sign server hiccups) versus
+        # answers that another attempt won't change
+        self._retryable_errors = (asyncio.TimeoutError, ConnectionError, httpx.TransportError, SignAPIError)
+        self._offline_errors = (UserOfflineError,)
+        self._final_errors = (UserNotFoundError, AgeRestrictedError)
+
+        # Connection pool shared by every client's httpx session, so TLS handshakes
+        # and keep-alive connections are reused across all monitored users. With h2
+        # installed, concurrent checks multiplex over a single HTTP/2 connection.
+        self._transport = httpx.AsyncHTTPTransport(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=8, keepalive_expiry=75)
+        )
+
+    def _make_client(self, username: str) -> "TikTokLiveClient":
+        """Create and configure a client for username."""
+        self.load_backend()
+
+        try:
+            client = self._client_cls(
+                unique_id=f"@{username}",
+                web_kwargs={"httpx_kwargs": {"transport": self._transport}}
+            )
+        except TypeError:
+            # TikTokLive version without httpx_kwargs support - use its own session
+            client = self._client_cls(unique_id=f"@{username}")
+
+        # The TikTokLive constructor resets its shared logger to ERROR; silence it again.
+        # Clients are cached, so this runs once per username rather than once per poll.
+        client.logger.setLevel(logging.CRITICAL)
+        return client
+
+    def _get_client(self, username: str) -> "TikTokLiveClient":
+        """Return the cached client for username, creating it on first use."""
+        client = self._clients.get(username)
+        if client is None:
+            client = self._clients[username] = self._make_client(username)
+        return client
+
     async def is_user_live(self, username: str) -> Optional[bool]:
         """
         Check if user is live with retry logic.
         Returns True if live, False if offline, None if unknown.
         """
+        # No TikTok account can have this name - don't build a client or hit the network
+        if not VALID_USERNAME.match(username):
+            return None
+
+        client = self._get_client(username)
+
         for attempt in range(3):
             try:
-                # Create client for this username
-                client = TikTokLiveClient(unique_id=f"@{username}")
-                client.logger.setLevel(LogLevel.CRITICAL.value)
-
-                # Check live status
-                is_live = await client.is_live()
+                # Check live status; abort hung requests so one user can't stall the others
+                is_live = await asyncio.wait_for(client.is_live(), timeout=REQUEST_TIMEOUT)
+                self._live_cache[username] = (time.monotonic(), is_live)
                 return is_live
 
-            except Exception:
+            except self._offline_errors:
+                self._live_cache[username] = (time.monotonic(), False)
+                return False
+
+            except self._final_errors:
+                return None  # e.g. the username doesn't exist - retrying won't help
+
+            except self._retryable_errors:
                 if attempt < 2:  # Only wait if not the last attempt
-                    # Exponential backoff with jitter
-                    delay = (2 ** attempt) + random.uniform(0, 1)
+                    # Capped exponential backoff with jitter, so retries fit within a poll interval
+                    delay = min(2 ** attempt, 8) + random.uniform(0, 0.5)
                     await asyncio.sleep(delay)
 
+            except Exception:
+                return None  # Unexpected response; report unknown and try again next poll
+
         return None  # Unknown status after all retries
 
+    async def _bounded_check(self, username: str) -> Optional[bool]:
+        """is_user_live, waiting for a free slot so large batches don't flood TikTok."""
+        async with self._check_slots:
+            return await self.is_user_live(username)
+
+    async def check_many(self, usernames: Iterable[str]) -> Dict[str, Optional[bool]]:
+        """Check several users at once so their request latencies overlap."""
+        usernames = list(usernames)
+        results = await asyncio.gather(*map(self._bounded_check, usernames), return_exceptions=True)
+        return {
+            username: None if isinstance(result, BaseException) else result
+            for username, result in zip(usernames, results)
+        }
+
     async def get_stream_url(self, username: str) -> Optional[str]:
         """
         Get the stream URL for recording if user is live.
         Skip double-check due to TikTok API inconsistencies.
         """
         try:
-            # Check with TikTokLive client
-            client = TikTokLiveClient(unique_id=f"@{username}")
-            client.logger.setLevel(LogLevel.CRITICAL.value)
+            # The monitor loop has usually just confirmed the user is live - don't ask again
+            cached = self._live_cache.get(username)
+            if cached and cached[1] and time.monotonic() - cached[0] < LIVE_CACHE_TTL:
+                is_live = True
+            else:
+                is_live = await self.is_user_live(username)
 
-            if await client.is_live():
+            if is_live:
                 stream_url = f"https://www.tiktok.com/@{username}/live"
                 print(f"🔍 TikTokLive confirms @{username} is live, attempting recording...")
                 return stream_url
@@ -55,4 +168,17 @@ class TikTokLiveChecker:
         except Exception as e:
             print(f"Error getting stream URL: {e}")
 
-        return None
\ No newline at end of file
+        return None
+
+    async def close(self) -> None:
+        """Close every client's HTTP session and the shared connection pool."""
+        for client in self._clients.values():
+            try:
+                await client.web.close()
+            except Exception:
+                pass
+        self._clients.clear()
+        self._live_cache.clear()
+
+        if self._transport is not None:
+            await self._transport.aclose()
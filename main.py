@@ -10,17 +10,35 @@ python main.py
 import asyncio
 import signal
 import sys
-from datetime import datetime
+import time
+from typing import Dict, List, Optional
 
-from managers.username_manager import UsernameManager
+from managers.username_manager import VALID_USERNAME, UsernameManager
 from managers.settings_manager import SettingsManager
 from checkers.tiktok_checker import TikTokLiveChecker
 from recorders.stream_recorder import StreamRecorder
 from ui.menu import (
     display_menu, get_user_choice, add_username_flow,
-    remove_username_flow, select_username_flow, toggle_recording_flow, check_dependencies_flow
+    remove_username_flow, select_usernames_flow, toggle_recording_flow, check_dependencies_flow
 )
 
+# ANSI colours for status lines
+_GREEN = "\033[32m"
+_RED = "\033[31m"
+_RESET = "\033[0m"
+
+
+class UserState:
+    """Monitoring state for a single username."""
+
+    def __init__(self):
+        self.last_status: Optional[bool] = None
+        self.recording_disabled_shown = False
+        # Consecutive OFFLINE->OFFLINE checks, used to back off polling
+        self.offline_streak = 0
+        self.next_check = 0.0
+        self.recorder = StreamRecorder()
+
 
 class TikTokLiveWatcher:
     """Main application class."""
@@ -29,83 +47,167 @@ class TikTokLiveWatcher:
         self.username_manager = UsernameManager()
         self.settings_manager = SettingsManager()
         self.checker = TikTokLiveChecker()
-        self.recorder = StreamRecorder()
-        self.last_status = None
-        self.recording_disabled_shown = False
+        self.user_states: Dict[str, UserState] = {}
+
+    async def monitor_users(self, usernames: List[str], interval: Optional[int] = None) -> None:
+        """Monitor several users concurrently, checking all of them each interval."""
+        # Names saved before validation existed would never be checked; say so once
+        # rather than reporting them as a network error every tick
+        invalid = [username for username in usernames if not VALID_USERNAME.match(username)]
+        if invalid:
+            print(f"⚠️  Skipping invalid username(s): {', '.join(f'@{username}' for username in invalid)}")
+            usernames = [username for username in usernames if username not in invalid]
+            if not usernames:
+                return
+
+        # Import problems are reported here, not disguised as a network error every tick
+        try:
+            self.checker.load_backend()
+        except ImportError as e:
+            print(f"Error: could not load TikTokLive ({e}). Install with: pip install TikTokLive")
+            return
 
-    async def monitor_user(self, username: str, interval: int = 60) -> None:
-        """Monitor user live status with recording support."""
-        print(f"\nMonitoring @{username} (Press Ctrl+C to stop)")
+        handles = ", ".join(f"@{username}" for username in usernames)
+        print(f"\nMonitoring {handles} (Press Ctrl+C to stop)")
 
-        self.last_status = None
-        self.recording_disabled_shown = False
+        # Fresh state per session so tasks never share status or recorders
+        self.user_states = {username: UserState() for username in usernames}
+
+        if interval is None:
+            interval = self.settings_manager.get_poll_base()
+
+        # `kill -USR1 <pid>` forces an immediate re-check (not available on Windows)
+        loop = asyncio.get_running_loop()
+        wake_signal = getattr(signal, 'SIGUSR1', None)
+        if wake_signal is not None:
+            loop.add_signal_handler(wake_signal, self.checker.wake.set)
 
         try:
-            while True:
-                current_status = await self.checker.is_user_live(username)
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            await self._monitor_loop(usernames, interval)
+
+        except KeyboardInterrupt:
+            print(f"\nStopped monitoring {handles}")
+            self._stop_all_recordings()
+        finally:
+            if wake_signal is not None:
+                loop.remove_signal_handler(wake_signal)
+
+    async def _monitor_loop(self, usernames: List[str], interval: int) -> None:
+        """Poll every due user's live status once per tick, forever."""
+        poll_max = max(self.settings_manager.get_poll_max(), interval)
+
+        while True:
+            now = time.monotonic()
+            due = [username for username in usernames if self.user_states[username].next_check <= now]
+
+            # All checks for a tick run concurrently
+            statuses = await self.checker.check_many(due)
+            # One timestamp shared by every line of this tick
+            timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+
+            lines = []
+            changes = []
+            for username, current_status in statuses.items():
+                state = self.user_states[username]
+
+                # Users that stay offline are checked less often; any change snaps back
+                if current_status is False and state.last_status is False:
+                    state.offline_streak += 1
+                else:
+                    state.offline_streak = 0
+                state.next_check = now + min(interval * (1 << min(state.offline_streak // 5, 3)), poll_max)
 
-                # Handle status changes and recording
-                await self._handle_status_change(username, current_status, timestamp)
+                # Handle status changes and recording; users are handled side by side
+                changes.append(self._handle_status_change(username, current_status, timestamp))
 
                 # Log status every check
                 if current_status is True:
-                    print(f"\033[32m🔴 [{timestamp}] @{username} is LIVE\033[0m")
+                    lines.append(f"{_GREEN}🔴 [{timestamp}] @{username} is LIVE{_RESET}")
                 elif current_status is False:
-                    print(f"\033[31m⚫ [{timestamp}] @{username} is OFFLINE\033[0m")
+                    lines.append(f"{_RED}⚫ [{timestamp}] @{username} is OFFLINE{_RESET}")
                 else:
-                    print(f"❓ [{timestamp}] @{username} status UNKNOWN (network error)")
-
-                await asyncio.sleep(interval)
-
-        except KeyboardInterrupt:
-            print(f"\nStopped monitoring @{username}")
-            self.recorder.stop_recording()
+                    lines.append(f"❓ [{timestamp}] @{username} status UNKNOWN (network error)")
+
+            # A slow recorder start/stop for one user doesn't hold up the others,
+            # though the next tick still waits for the slowest of them
+            await asyncio.gather(*changes)
+
+            # One write per tick instead of one print per user
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+
+            # Swap in remuxed recordings whose background ffmpeg has finished
+            for state in self.user_states.values():
+                state.recorder.reap_pending_fixes()
+
+            next_check = min(state.next_check for state in self.user_states.values())
+            try:
+                await asyncio.wait_for(self.checker.wake.wait(), timeout=max(next_check - time.monotonic(), 0))
+                # Woken early: everyone is due on the next tick
+                for state in self.user_states.values():
+                    state.next_check = 0.0
+            except asyncio.TimeoutError:
+                pass
+            self.checker.wake.clear()
 
     async def _handle_status_change(self, username: str, current_status, timestamp: str) -> None:
         """Handle status changes and recording logic."""
+        state = self.user_states[username]
+        recorder = state.recorder
         recording_enabled = self.settings_manager.get_recording_enabled()
 
         # First time detection or status change from OFFLINE to LIVE
-        if (self.last_status is None and current_status is True) or (self.last_status is False and current_status is True):
-            if self.last_status is None:
+        if (state.last_status is None and current_status is True) or (state.last_status is False and current_status is True):
+            if state.last_status is None:
                 print(f"🔄 Initial detection: @{username} is LIVE")
             else:
                 print(f"🔄 Status change: @{username} went LIVE")
 
-            if recording_enabled and not self.recorder.is_recording():
+            if recording_enabled and not recorder.is_recording():
                 print(f"📹 Recording enabled - attempting to start recording...")
                 stream_url = await self.checker.get_stream_url(username)
                 if stream_url:
-                    success = self.recorder.start_recording(username, stream_url)
+                    # Starting probes the recorder for a few seconds; keep it off the event loop
+                    success = await asyncio.to_thread(recorder.start_recording, username, stream_url)
                     if not success:
                         print(f"❌ Failed to start recording for @{username}")
                 else:
                     print(f"⚠️  Could not get stream URL for recording @{username}")
             else:
-                if not recording_enabled and not self.recording_disabled_shown:
+                if not recording_enabled and not state.recording_disabled_shown:
                     print("📹 Recording disabled (toggle in menu: 4)")
-                    self.recording_disabled_shown = True
+                    state.recording_disabled_shown = True
 
         # Status change from LIVE to OFFLINE
-        elif self.last_status is True and current_status is False:
+        elif state.last_status is True and current_status is False:
             print(f"🔄 Status change: @{username} went OFFLINE")
-            if self.recorder.is_recording():
+            if recorder.is_recording():
                 print("⏹️  Stopping recording...")
-                self.recorder.stop_recording()
+                await asyncio.to_thread(recorder.stop_recording)
 
-        self.last_status = current_status
+        state.last_status = current_status
+
+    def _stop_all_recordings(self) -> None:
+        """Stop and clean up every user's recorder."""
+        for state in self.user_states.values():
+            state.recorder.cleanup()
 
     def setup_signal_handlers(self) -> None:
         """Setup signal handlers for clean exit."""
         def signal_handler(signum, frame):
             print("\nReceived interrupt signal. Cleaning up...")
-            self.recorder.cleanup()
+            self._stop_all_recordings()
             sys.exit(0)
 
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
 
+    def _flush_managers(self) -> None:
+        """Persist any pending username/settings changes."""
+        self.username_manager.flush()
+        self.settings_manager.flush()
+
     async def run(self) -> None:
         """Main application loop."""
         self.setup_signal_handlers()
@@ -123,9 +225,10 @@ class TikTokLiveWatcher:
                 elif choice == 2:
                     remove_username_flow(self.username_manager)
                 elif choice == 3:
-                    selected_username = select_username_flow(self.username_manager)
-                    if selected_username:
-                        await self.monitor_user(selected_username)
+                    selected_usernames = select_usernames_flow(self.username_manager)
+                    if selected_usernames:
+                        self._flush_managers()
+                        await self.monitor_users(selected_usernames)
                 elif choice == 4:
                     toggle_recording_flow(self.settings_manager)
                 elif choice == 5:
@@ -134,7 +237,9 @@ class TikTokLiveWatcher:
         except KeyboardInterrupt:
             print("\nExiting...")
         finally:
-            self.recorder.cleanup()
+            self._stop_all_recordings()
+            self._flush_managers()
+            await self.checker.close()
 
 
 async def main() -> None:
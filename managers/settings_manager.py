@@ -1,6 +1,11 @@
-import json
+import math
 import os
 
+from managers.storage import atomic_write_json, load_json
+
+# Shortest poll interval accepted from settings.json, so a bad value can't hammer TikTok
+MIN_POLL_SECONDS = 5
+
 
 class SettingsManager:
     """Manages settings with local JSON persistence."""
@@ -8,22 +13,21 @@ class SettingsManager:
     def __init__(self, filename: str = "settings.json"):
         self.filename = filename
         self.settings = self._load_settings()
+        self._dirty = False
 
     def _load_settings(self) -> dict:
         """Load settings from JSON file."""
         try:
             if os.path.exists(self.filename):
-                with open(self.filename, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                return load_json(self.filename)
             return {"recording_enabled": False}
-        except (json.JSONDecodeError, IOError, KeyError):
+        except (ValueError, IOError, KeyError):
             return {"recording_enabled": False}
 
     def _save_settings(self) -> None:
         """Save settings to JSON file."""
         try:
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=2)
+            atomic_write_json(self.filename, self.settings)
         except IOError:
             print("Error: Failed to save settings to file")
 
@@ -31,8 +35,30 @@ class SettingsManager:
         """Get recording enabled status."""
         return self.settings.get("recording_enabled", False)
 
+    def _get_seconds(self, key: str, default: int) -> int:
+        """Get an interval setting, falling back to default unless it's a finite number."""
+        value = self.settings.get(key, default)
+        # bool is an int subclass, but true/false is not a duration
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            return default
+        return max(int(value), MIN_POLL_SECONDS)
+
+    def get_poll_base(self) -> int:
+        """Get seconds between live checks."""
+        return self._get_seconds("poll_base", 60)
+
+    def get_poll_max(self) -> int:
+        """Get longest interval, in seconds, for users that stay offline."""
+        return max(self._get_seconds("poll_max", 300), self.get_poll_base())
+
     def toggle_recording(self) -> bool:
         """Toggle recording setting and return new value."""
         self.settings["recording_enabled"] = not self.settings.get("recording_enabled", False)
-        self._save_settings()
-        return self.settings["recording_enabled"]
\ No newline at end of file
+        self._dirty = True
+        return self.settings["recording_enabled"]
+
+    def flush(self) -> None:
+        """Write pending settings changes to disk."""
+        if self._dirty:
+            self._save_settings()
+            self._dirty = False
\ No newline at end of file
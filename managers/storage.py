@@ -0,0 +1,32 @@
+import json
+import os
+
+try:
+    import orjson  # Optional: C JSON codec, several times faster than json
+except ImportError:
+    orjson = None
+
+
+def load_json(path: str):
+    """Read path in a single read and parse it as JSON (ValueError if malformed)."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def atomic_write_json(path: str, obj, indent=None) -> None:
+    """Write obj as JSON to path atomically (temp file + rename), in a single write."""
+    if orjson is not None:
+        # orjson is always compact unless indented; it only supports 2-space indents
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    else:
+        # Compact by default: smaller file and faster to parse on the next load
+        separators = (',', ':') if indent is None else None
+        data = json.dumps(obj, indent=indent, separators=separators).encode('utf-8')
+
+    tmp = path + '.tmp'
+    with open(tmp, 'wb', buffering=0) as f:
+        f.write(data)
+    os.replace(tmp, path)
@@ -1,6 +1,12 @@
-import json
 import os
-from typing import List
+import re
+from typing import Dict, List, Tuple
+
+from managers.storage import atomic_write_json, load_json
+
+# TikTok usernames: up to 24 letters, digits, underscores and periods
+# (case-insensitive: TikTok handles are; names are stored lowercased)
+VALID_USERNAME = re.compile(r'^[a-z0-9_.]{1,24}$', re.IGNORECASE | re.ASCII)
 
 
 class UsernameManager:
@@ -8,48 +14,58 @@ class UsernameManager:
 
     def __init__(self, filename: str = "usernames.json"):
         self.filename = filename
-        self.usernames = self._load_usernames()
+        # Insertion-ordered set: O(1) membership while keeping display order
+        self.usernames: Dict[str, None] = dict.fromkeys(self._load_usernames())
+        self._dirty = False
+        # Bumped on every add/remove so callers can tell when a snapshot is stale
+        self.version = 0
 
     def _load_usernames(self) -> List[str]:
         """Load usernames from JSON file."""
         try:
             if os.path.exists(self.filename):
-                with open(self.filename, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get('usernames', [])
+                data = load_json(self.filename)
+                return data.get('usernames', [])
             return []
-        except (json.JSONDecodeError, IOError, KeyError):
+        except (ValueError, IOError, KeyError):
             return []
 
     def _save_usernames(self) -> None:
         """Save usernames to JSON file."""
         try:
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                json.dump({'usernames': self.usernames}, f, indent=2)
+            atomic_write_json(self.filename, {'usernames': list(self.usernames)})
         except IOError:
             print("Error: Failed to save usernames to file")
 
     def add_username(self, username: str) -> bool:
         """Add username (validated, trimmed, lowercase, deduplicated)."""
         username = username.strip().lower()
-        if not username:
+        if not VALID_USERNAME.match(username):
             return False
         if username in self.usernames:
             return False
 
-        self.usernames.append(username)
-        self._save_usernames()
+        self.usernames[username] = None
+        self._dirty = True
+        self.version += 1
         return True
 
     def remove_username(self, username: str) -> bool:
         """Remove username if it exists."""
         username = username.strip().lower()
         if username in self.usernames:
-            self.usernames.remove(username)
-            self._save_usernames()
+            del self.usernames[username]
+            self._dirty = True
+            self.version += 1
             return True
         return False
 
-    def get_usernames(self) -> List[str]:
-        """Get copy of usernames list."""
-        return self.usernames.copy()
\ No newline at end of file
+    def get_usernames(self) -> Tuple[str, ...]:
+        """Get read-only snapshot of usernames."""
+        return tuple(self.usernames)
+
+    def flush(self) -> None:
+        """Write pending username changes to disk."""
+        if self._dirty:
+            self._save_usernames()
+            self._dirty = False
@@ -1,9 +1,19 @@
+import collections
+import functools
 import os
+import shutil
 import sys
 import subprocess
-import glob
-from datetime import datetime
-from typing import Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+# How long a freshly started recorder must survive to count as started
+STARTUP_PROBE_SECONDS = 3
+
+# Longest cleanup() waits for background remuxes before leaving them to finish alone
+CLEANUP_FIX_WAIT_SECONDS = 30
 
 
 class StreamRecorder:
@@ -11,6 +21,18 @@ class StreamRecorder:
 
     def __init__(self):
         self.active_process: Optional[subprocess.Popen] = None
+        # Output file of the current recording, so it can be fixed without scanning Recordings/
+        self._current_filepath: Optional[str] = None
+        # ffmpeg muxing streamlink's output into the recording, when ffmpeg is available
+        self._mux_process: Optional[subprocess.Popen] = None
+        # Last lines of the recorder's stderr, drained by a background thread so the
+        # pipe never fills up and stalls a long recording
+        self._stderr_tail: collections.deque = collections.deque(maxlen=100)
+        self._stderr_thread: Optional[threading.Thread] = None
+        # Set once the recorder process has exited; checks read this instead of waitpid
+        self._child_exited = threading.Event()
+        # Background ffmpeg remuxes: (process, recording, fixed output, monotonic deadline)
+        self._pending_fixes: List[Tuple[subprocess.Popen, str, str, float]] = []
 
         # Get the directory where the executable is located
         if getattr(sys, 'frozen', False):
@@ -23,8 +45,11 @@ class StreamRecorder:
 
         self.recordings_dir = os.path.join(app_dir, "Recordings")
         os.makedirs(self.recordings_dir, exist_ok=True)
+        # Resolved once; ffmpeg doesn't appear or move while the app runs
+        self._ffmpeg_path: Optional[str] = self._get_ffmpeg_path()
 
-    def _get_ffmpeg_path(self) -> str:
+    @staticmethod
+    def _get_ffmpeg_path() -> Optional[str]:
         """Get path to ffmpeg (bundled or system)."""
         # Check if running as PyInstaller bundle with bundled ffmpeg
         if getattr(sys, 'frozen', False):
@@ -42,47 +67,24 @@ class StreamRecorder:
                     return ffmpeg_path
 
         # Check system PATH
-        try:
-            import shutil
-            system_ffmpeg = shutil.which("ffmpeg")
-            if system_ffmpeg:
-                return system_ffmpeg
-        except:
-            pass
-
-        return None
+        return shutil.which("ffmpeg")
 
-    def check_dependencies(self) -> tuple[bool, bool, bool]:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def check_dependencies() -> tuple[bool, bool, bool]:
         """Check if streamlink, yt-dlp, and ffmpeg are available."""
-        streamlink_available = False
-        ytdlp_available = False
-        ffmpeg_available = False
-
-        try:
-            subprocess.run(['streamlink', '--version'],
-                         capture_output=True, check=True)
-            streamlink_available = True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
-
-        try:
-            subprocess.run(['yt-dlp', '--version'],
-                         capture_output=True, check=True)
-            ytdlp_available = True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
-
-        # Check for ffmpeg (bundled or system)
-        ffmpeg_cmd = self._get_ffmpeg_path()
-        if ffmpeg_cmd:
-            try:
-                subprocess.run([ffmpeg_cmd, '-version'],
-                             capture_output=True, check=True)
-                ffmpeg_available = True
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                pass
-
-        return streamlink_available, ytdlp_available, ffmpeg_available
+        # PATH lookups only, cached for the session; check_dependencies.cache_clear()
+        # forces a fresh probe. The three lookups are independent stat() walks, so
+        # they run side by side and a slow PATH entry is only paid for once.
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            streamlink = pool.submit(shutil.which, 'streamlink')
+            ytdlp = pool.submit(shutil.which, 'yt-dlp')
+            ffmpeg = pool.submit(StreamRecorder._get_ffmpeg_path)
+            return (
+                streamlink.result() is not None,
+                ytdlp.result() is not None,
+                ffmpeg.result() is not None,
+            )
 
     def start_recording(self, username: str, stream_url: str) -> bool:
         """Start recording stream to file using streamlink (preferred) or yt-dlp fallback."""
@@ -105,16 +107,66 @@ class StreamRecorder:
             print("Error: Neither streamlink nor yt-dlp found. Install with: pip install streamlink yt-dlp")
             return False
 
+    def _spawn(self, cmd: list, stdout=subprocess.DEVNULL) -> subprocess.Popen:
+        """Start a recorder process, draining its stderr in the background."""
+        # stderr stays bytes; it is only decoded if someone actually reads it
+        proc = subprocess.Popen(
+            cmd,
+            stdout=stdout,
+            stderr=subprocess.PIPE
+        )
+        self._stderr_tail = collections.deque(maxlen=100)
+        self._child_exited = threading.Event()
+        self._stderr_thread = threading.Thread(
+            target=self._drain_stderr, args=(proc, self._stderr_tail), daemon=True
+        )
+        self._stderr_thread.start()
+        # Separate from the drainer: a grandchild (e.g. yt-dlp's ffmpeg) can keep
+        # stderr open long after the recorder itself has exited
+        threading.Thread(
+            target=self._watch_exit, args=(proc, self._child_exited), daemon=True
+        ).start()
+        return proc
+
+    @staticmethod
+    def _drain_stderr(proc: subprocess.Popen, tail: collections.deque) -> None:
+        """Read proc's stderr until EOF, keeping only the last lines."""
+        for line in proc.stderr:
+            tail.append(line)
+        proc.stderr.close()
+
+    @staticmethod
+    def _watch_exit(proc: subprocess.Popen, exited: threading.Event) -> None:
+        """Reap proc with one blocking wait and wake anyone waiting on its exit."""
+        proc.wait()
+        exited.set()
+
+    def _stderr_text(self) -> str:
+        """Captured stderr of the exited recorder process."""
+        if self._stderr_thread is not None:
+            # The drainer hits EOF right after the process exits
+            self._stderr_thread.join(timeout=1)
+        return b"".join(self._stderr_tail).decode("utf-8", errors="replace")
+
+    def _recording_base_path(self, username: str) -> str:
+        """Timestamped output path, without extension, for a new recording."""
+        timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
+        return os.path.join(self.recordings_dir, f"{username}_{timestamp}")
+
     def _start_recording_streamlink(self, username: str, stream_url: str) -> bool:
         """Record using streamlink (preferred method)."""
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        filename = f"{username}_{timestamp}.mp4"
-        filepath = os.path.join(self.recordings_dir, filename)
+        base_path = self._recording_base_path(username)
+        filepath = base_path + ".mp4"
+        filename = os.path.basename(filepath)
+        self._current_filepath = filepath
+        ffmpeg_cmd = self._ffmpeg_path
 
         try:
+            # With ffmpeg, streamlink writes to stdout and ffmpeg muxes while recording
+            output_args = ['--stdout'] if ffmpeg_cmd else ['--output', filepath]
             cmd = [
                 'streamlink',
-                '--output', filepath,
+                *output_args,
                 '--loglevel', 'error',
                 '--retry-streams', '3',
                 '--retry-max', '10',
@@ -127,21 +179,37 @@ class StreamRecorder:
             print(f"🔗 URL: {stream_url}")
             print(f"💾 Output: {filepath}")
 
-            self.active_process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            if ffmpeg_cmd:
+                self.active_process = self._spawn(cmd, stdout=subprocess.PIPE)
+                # Fragmented MP4 with the moov up front is seekable as written, so the
+                # recording needs no second remux pass when it stops
+                self._mux_process = subprocess.Popen(
+                    [
+                        ffmpeg_cmd, '-loglevel', 'error',
+                        '-i', 'pipe:0',
+                        '-c', 'copy',
+                        '-movflags', '+frag_keyframe+empty_moov+default_base_moof',
+                        '-avoid_negative_ts', 'make_zero',
+                        '-f', 'mp4', filepath,
+                        '-y'
+                    ],
+                    stdin=self.active_process.stdout,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+                # ffmpeg owns the read end now; streamlink stops if ffmpeg dies
+                self.active_process.stdout.close()
+                self._current_filepath = None
+            else:
+                self.active_process = self._spawn(cmd)
 
-            # Check if streamlink starts successfully
-            import time
-            time.sleep(3)
-            if self.active_process.poll() is not None:
-                stdout, stderr = self.active_process.communicate()
+            # Check if streamlink starts successfully; a failing start exits within seconds
+            if self._child_exited.wait(STARTUP_PROBE_SECONDS):
+                stderr = self._stderr_text()
                 if "error:" in stderr.lower() or "no streams found" in stderr.lower():
                     print(f"❌ Streamlink failed: {stderr.strip()}")
                     self.active_process = None
+                    self._stop_mux()
                     return False
 
             print(f"✅ Streamlink recording started successfully!")
@@ -153,9 +221,10 @@ class StreamRecorder:
 
     def _start_recording_ytdlp(self, username: str, stream_url: str) -> bool:
         """Fallback to yt-dlp recording."""
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        filename = f"{username}_{timestamp}.%(ext)s"
-        filepath = os.path.join(self.recordings_dir, filename)
+        base_path = self._recording_base_path(username)
+        filepath = base_path + ".%(ext)s"
+        # yt-dlp fills in the extension; only mp4 output is fixed afterwards
+        self._current_filepath = base_path + ".mp4"
 
         try:
             cmd = [
@@ -168,15 +237,10 @@ class StreamRecorder:
                 stream_url
             ]
 
-            print(f"📹 Starting recording with yt-dlp: {username}_{timestamp}")
+            print(f"📹 Starting recording with yt-dlp: {os.path.basename(base_path)}")
             print(f"🔗 URL: {stream_url}")
 
-            self.active_process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+            self.active_process = self._spawn(cmd)
 
             return True
 
@@ -189,12 +253,13 @@ class StreamRecorder:
         if self.active_process:
             recorded_file = None
             try:
-                if self.active_process.poll() is None:
+                if not self._child_exited.is_set():
                     self.active_process.terminate()
-                    self.active_process.wait(timeout=5)
+                    if not self._child_exited.wait(timeout=5):
+                        raise subprocess.TimeoutExpired(self.active_process.args, 5)
                     print("⏹️  Stopped recording")
                 else:
-                    stdout, stderr = self.active_process.communicate()
+                    stderr = self._stderr_text()
                     if stderr and "error" in stderr.lower():
                         print(f"Recording error: {stderr.strip()}")
                     print("⏹️  Recording finished")
@@ -204,53 +269,61 @@ class StreamRecorder:
 
             except subprocess.TimeoutExpired:
                 self.active_process.kill()
+                self.active_process.wait()
                 print("🔴 Force stopped recording")
+                # Whatever was written so far still needs its metadata fixed
+                self._fix_recorded_files()
             except Exception as e:
                 print(f"Error stopping recording: {e}")
             finally:
                 self.active_process = None
+                self._stop_mux()
+
+    def _stop_mux(self) -> None:
+        """Let ffmpeg finish writing once streamlink has exited; kill it if it hangs."""
+        if self._mux_process is None:
+            return
+        try:
+            self._mux_process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._mux_process.kill()
+            self._mux_process.wait()
+        finally:
+            self._mux_process = None
 
     def get_recording_status(self) -> str:
         """Get detailed recording status for debugging."""
         if not self.active_process:
             return "No active recording"
 
-        if self.active_process.poll() is None:
+        if not self._child_exited.is_set():
             return "Recording in progress"
         else:
-            try:
-                stdout, stderr = self.active_process.communicate(timeout=1)
-                if stderr:
-                    return f"Recording failed: {stderr.strip()}"
-                return "Recording completed"
-            except subprocess.TimeoutExpired:
-                return "Recording status unknown"
+            stderr = self._stderr_text()
+            if stderr:
+                return f"Recording failed: {stderr.strip()}"
+            return "Recording completed"
 
     def is_recording(self) -> bool:
         """Check if currently recording."""
         if self.active_process:
-            return self.active_process.poll() is None
+            return not self._child_exited.is_set()
         return False
 
     def _fix_recorded_files(self) -> None:
         """Fix metadata and seekability of recorded files using ffmpeg if available."""
+        # The file the recording that just stopped was writing
+        latest_file = self._current_filepath
+        self._current_filepath = None
+        if not latest_file or not os.path.exists(latest_file):
+            return
+
         try:
-            # Get ffmpeg path (bundled or system)
-            ffmpeg_cmd = self._get_ffmpeg_path()
+            # Resolved once in __init__; no per-stop probe of the binary
+            ffmpeg_cmd = self._ffmpeg_path
             if not ffmpeg_cmd:
                 return
 
-            # Test ffmpeg
-            subprocess.run([ffmpeg_cmd, '-version'], capture_output=True, check=True)
-
-            # Find the most recent .mp4 file in recordings directory
-            mp4_files = glob.glob(os.path.join(self.recordings_dir, "*.mp4"))
-            if not mp4_files:
-                return
-
-            # Get the most recently modified file
-            latest_file = max(mp4_files, key=os.path.getmtime)
-
             # Create fixed filename
             base_name = os.path.splitext(latest_file)[0]
             fixed_file = f"{base_name}_fixed.mp4"
@@ -267,22 +340,73 @@ class StreamRecorder:
                 '-y'  # Overwrite if exists
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0:
+            # -c copy is I/O bound: allow ~2s per MB, at least a minute
+            size_mb = os.path.getsize(latest_file) / (1024 * 1024)
+            deadline = time.monotonic() + max(60, size_mb * 2)
+
+            # Remux in the background so stopping a recording returns immediately; its own
+            # session keeps a Ctrl+C in the terminal from killing it halfway
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True
+            )
+            self._pending_fixes.append((proc, latest_file, fixed_file, deadline))
+
+        except FileNotFoundError:
+            # ffmpeg was removed since it was found, skip fixing
+            pass
+        except Exception as e:
+            print(f"Error fixing recorded file: {e}")
+
+    def reap_pending_fixes(self, wait: float = 0) -> None:
+        """Finish background remuxes that have exited, blocking up to wait seconds in total."""
+        give_up = time.monotonic() + wait
+        still_running = []
+        for proc, recorded_file, fixed_file, deadline in self._pending_fixes:
+            if wait:
+                try:
+                    proc.wait(timeout=max(min(deadline, give_up) - time.monotonic(), 0))
+                except subprocess.TimeoutExpired:
+                    pass
+
+            if proc.poll() is None:
+                if time.monotonic() < deadline:
+                    still_running.append((proc, recorded_file, fixed_file, deadline))
+                    continue
+                proc.kill()
+                proc.wait()
+                print("⚠️  Fixing video metadata timed out")
+            elif proc.returncode == 0:
                 # Replace original file with fixed version
-                os.replace(fixed_file, latest_file)
+                try:
+                    os.replace(fixed_file, recorded_file)
+                except OSError as e:
+                    # e.g. the recording is open in a player on Windows, or was deleted
+                    print(f"⚠️  Could not replace {recorded_file} with the fixed video: {e}")
+                    if os.path.exists(fixed_file):
+                        print(f"   Fixed copy kept at: {fixed_file}")
+                    continue
                 print("✅ Video fixed - now supports seeking and shows duration")
+                continue
             else:
                 print("⚠️  Could not fix video metadata")
-                if os.path.exists(fixed_file):
-                    os.remove(fixed_file)
 
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            # ffmpeg not available, skip fixing
-            pass
-        except Exception as e:
-            print(f"Error fixing recorded file: {e}")
+            try:
+                os.remove(fixed_file)
+            except OSError:
+                pass
+
+        self._pending_fixes = still_running
 
     def cleanup(self) -> None:
         """Clean up any active recordings."""
-        self.stop_recording()
\ No newline at end of file
+        self.stop_recording()
+        if self._pending_fixes:
+            print("🔧 Waiting for video fixes to finish...")
+            self.reap_pending_fixes(wait=CLEANUP_FIX_WAIT_SECONDS)
+            # Remuxes run in their own session, so slower ones carry on after we exit
+            for _, recorded_file, fixed_file, _ in self._pending_fixes:
+                print(f"⏳ Still fixing {os.path.basename(recorded_file)} in the background: {fixed_file}")
+            self._pending_fixes = []
\ No newline at end of file
@@ -7,15 +7,32 @@ python tiktok_live_watcher.py
 
 import asyncio
 import json
+import logging
 import os
 import random
 import subprocess
 import time
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+import httpx
 from TikTokLive import TikTokLiveClient
-from TikTokLive.client.logger import LogLevel
+from TikTokLive.client.errors import AgeRestrictedError, SignAPIError, UserNotFoundError, UserOfflineError
+
+try:
+    import orjson  # Optional: C JSON codec, several times faster than json
+except ImportError:
+    orjson = None
+
+# Disable logging for cleaner output
+logging.getLogger('TikTokLive').setLevel(logging.CRITICAL)
+
+# Pretty-print usernames.json only when debugging; compact is smaller and faster
+DEBUG = bool(os.environ.get("TIKTOK_WATCHER_DEBUG"))
+
+# Failures worth retrying, versus answers another attempt won't change
+RETRYABLE_ERRORS = (asyncio.TimeoutError, ConnectionError, httpx.TransportError, SignAPIError)
+FINAL_ERRORS = (UserNotFoundError, AgeRestrictedError)
 
 
 class UsernameManager:
@@ -23,24 +40,36 @@ class UsernameManager:
 
     def __init__(self, filename: str = "usernames.json"):
         self.filename = filename
-        self.usernames = self._load_usernames()
+        # Insertion-ordered set: O(1) membership while keeping display order
+        self.usernames: Dict[str, None] = dict.fromkeys(self._load_usernames())
 
     def _load_usernames(self) -> List[str]:
         """Load usernames from JSON file."""
         try:
             if os.path.exists(self.filename):
-                with open(self.filename, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get('usernames', [])
+                with open(self.filename, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                return data.get('usernames', [])
             return []
-        except (json.JSONDecodeError, IOError, KeyError):
+        except (ValueError, IOError, KeyError):
             return []
 
     def _save_usernames(self) -> None:
         """Save usernames to JSON file."""
         try:
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                json.dump({'usernames': self.usernames}, f, indent=2)
+            # Write a temp file and rename it over the old one, so a crash can't truncate it
+            obj = {'usernames': list(self.usernames)}
+            if orjson is not None:
+                data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 if DEBUG else 0)
+            else:
+                data = json.dumps(obj, indent=2 if DEBUG else None,
+                                  separators=None if DEBUG else (',', ':')).encode('utf-8')
+
+            tmp = self.filename + '.tmp'
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, self.filename)
         except IOError:
             print("Error: Failed to save usernames to file")
 
@@ -52,7 +81,7 @@ class UsernameManager:
         if username in self.usernames:
             return False
 
-        self.usernames.append(username)
+        self.usernames[username] = None
         self._save_usernames()
         return True
 
@@ -60,47 +89,71 @@ class UsernameManager:
         """Remove username if it exists."""
         username = username.strip().lower()
         if username in self.usernames:
-            self.usernames.remove(username)
+            del self.usernames[username]
             self._save_usernames()
             return True
         return False
 
     def get_usernames(self) -> List[str]:
         """Get copy of usernames list."""
-        return self.usernames.copy()
+        return list(self.usernames)
 
 
 class TikTokLiveChecker:
     """Checks TikTok live status using TikTokLive library."""
 
     def __init__(self):
-        # Disable logging for cleaner output
-        import logging
-        logging.getLogger('TikTokLive').setLevel(logging.CRITICAL)
+        # One client per username, reused across polls so its HTTP session stays warm
+        self._clients: Dict[str, TikTokLiveClient] = {}
+
+    def _get_client(self, username: str) -> TikTokLiveClient:
+        """Return the cached client for username, creating it on first use."""
+        client = self._clients.get(username)
+        if client is None:
+            client = self._clients[username] = TikTokLiveClient(unique_id=f"@{username}")
+            # The constructor resets the shared TikTokLive logger to ERROR
+            client.logger.setLevel(logging.CRITICAL)
+        return client
 
     async def is_user_live(self, username: str) -> Optional[bool]:
         """
         Check if user is live with retry logic.
         Returns True if live, False if offline, None if unknown.
         """
+        client = self._get_client(username)
+
         for attempt in range(3):
             try:
-                # Create client for this username
-                client = TikTokLiveClient(unique_id=f"@{username}")
-                client.logger.setLevel(LogLevel.CRITICAL.value)
-
                 # Check live status
                 is_live = await client.is_live()
                 return is_live
 
-            except Exception:
+            except UserOfflineError:
+                return False
+
+            except FINAL_ERRORS:
+                return None  # e.g. the username doesn't exist - retrying won't help
+
+            except RETRYABLE_ERRORS:
                 if attempt < 2:  # Only wait if not the last attempt
                     # Exponential backoff with jitter
                     delay = (2 ** attempt) + random.uniform(0, 1)
                     await asyncio.sleep(delay)
 
+            except Exception:
+                return None  # Unexpected response; report unknown and try again next poll
+
         return None  # Unknown status after all retries
 
+    async def close(self) -> None:
+        """Close every cached client's HTTP session."""
+        for client in self._clients.values():
+            try:
+                await client.web.close()
+            except Exception:
+                pass
+        self._clients.clear()
+
 
 def display_menu(username_manager: UsernameManager) -> None:
     """Display the main menu."""
@@ -261,6 +314,8 @@ async def main() -> None:
 
     except KeyboardInterrupt:
         print("\nExiting...")
+    finally:
+        await checker.close()
 
 
 if __name__ == "__main__":
@@ -1,53 +1,200 @@
-from typing import Optional
+import os
+import sys
+from typing import List, Optional
 
 from managers.username_manager import UsernameManager
 from managers.settings_manager import SettingsManager
 from recorders.stream_recorder import StreamRecorder
 
+# Colours and "Press Enter" pauses only make sense when a person is at the terminal
+_STDOUT_TTY = bool(sys.stdout and sys.stdout.isatty())
+_INTERACTIVE_TTY = _STDOUT_TTY and bool(sys.stdin and sys.stdin.isatty())
+
+# Main menu, rendered once; only the recording status line varies
+_MENU_HEAD = (
+    "\nTikTok Live Watcher\n"
+    + "=" * 20 + "\n"
+    "1) Add a new username\n"
+    "2) Remove existing username\n"
+    "3) Show available usernames\n"
+)
+_MENU_TAIL = "5) Check dependencies\n\n0) Exit\n"
+if _STDOUT_TTY:
+    _TRUE_TEXT = "\033[32m\033[1mTrue\033[0m"  # Green bold
+    _FALSE_TEXT = "\033[31m\033[1mFalse\033[0m"  # Red bold
+else:
+    _TRUE_TEXT, _FALSE_TEXT = "True", "False"
+_STATUS_TRUE = f"4) Record stream – {_TRUE_TEXT}\n" + _MENU_TAIL
+_STATUS_FALSE = f"4) Record stream – {_FALSE_TEXT}\n" + _MENU_TAIL
+# Indexed by the recording flag: False -> 0, True -> 1
+_STATUS = (_STATUS_FALSE, _STATUS_TRUE)
+# The full menu pre-encoded for stdout's byte buffer, newlines as the text layer would write them
+try:
+    _MENU_BYTES: Optional[tuple] = tuple(
+        (_MENU_HEAD + status).replace("\n", os.linesep).encode(
+            getattr(sys.stdout, 'encoding', None) or 'utf-8',
+            getattr(sys.stdout, 'errors', None) or 'strict',
+        )
+        for status in _STATUS
+    )
+except UnicodeEncodeError:
+    _MENU_BYTES = None
+
+# Submenu headers, separators included
+_ADD_HEAD = "\nAdd Username\n" + "-" * 12 + "\n1) Return to main menu\n"
+_REMOVE_HEAD = ("\nRemove Username", "-" * 15, "1) Return to main menu")
+_SELECT_MANY_HEAD = ("\nSelect Usernames to Monitor", "-" * 27, "1) Return to main menu")
+_DEPS_HEAD = "\n🔍 Checking Dependencies\n" + "=" * 25 + "\n"
+
+# Dependency result lines, indexed by availability: (missing, available)
+_STREAMLINK_HINT = (
+    "❌ streamlink: Not found\n   Install with: pip install streamlink\n",
+    "✅ streamlink: Available\n",
+)
+_YTDLP_HINT = (
+    "⚠️  yt-dlp: Not found (optional fallback)\n   Install with: pip install yt-dlp\n",
+    "✅ yt-dlp: Available\n",
+)
+_FFMPEG_HINT = (
+    "❌ ffmpeg: Not found\n   Download from: https://ffmpeg.org/\n",
+    "✅ ffmpeg: Available\n",
+)
+_STREAMLINK_MISSING = (
+    "⚠️  Recording will NOT work - streamlink is missing\n"
+    "   Run setup.bat again or install manually\n"
+)
+# Overall verdict keyed by (streamlink available, ffmpeg available)
+_DEPS_SUMMARY = {
+    (True, True): (
+        "🎉 All dependencies are installed!\n"
+        "   Recording works + automatic video fixing\n"
+    ),
+    (True, False): (
+        "✅ Recording will work!\n"
+        "   But videos may have seeking/duration issues\n"
+        "   Install ffmpeg for automatic video fixing\n"
+    ),
+    (False, True): _STREAMLINK_MISSING,
+    (False, False): _STREAMLINK_MISSING,
+}
+
+
+def _read_line(prompt: str) -> str:
+    """Prompt and read one line from stdin; raises EOFError like input()."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    if _INTERACTIVE_TTY:
+        return _read_tty_line()
+
+    # One buffered read per line, without readline's per-keystroke handling
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\r\n")
+
+
+# Bytes read from the terminal past the last newline (typed-ahead or pasted
+# input), handed to the next prompt instead of being lost
+_tty_pending = b""
+
+
+def _read_tty_line() -> str:
+    """Read one line straight from the terminal's fd, keeping anything after it."""
+    global _tty_pending
+    # A cooked-mode terminal hands over one whole line per read(), so this is
+    # normally a single syscall with no TextIOWrapper or readline in between
+    fd = sys.stdin.fileno()
+    data = _tty_pending
+    while b"\n" not in data:
+        chunk = os.read(fd, 64)
+        if not chunk:
+            break
+        data += chunk
+    line, newline, _tty_pending = data.partition(b"\n")
+    if not line and not newline:
+        raise EOFError
+    return line.decode(sys.stdin.encoding or 'utf-8', 'ignore').rstrip("\r")
+
+
+def _write_lines(lines: List[str]) -> None:
+    """Write newline-terminated lines to stdout with a single syscall where possible."""
+    if hasattr(os, 'writev'):
+        try:
+            fd = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            fd = None
+        if fd is not None:
+            # POSIX: hand the kernel one buffer per line instead of joining them first
+            encoding = sys.stdout.encoding or 'utf-8'
+            errors = sys.stdout.errors or 'strict'
+            vec = [f"{line}\n".encode(encoding, errors) for line in lines]
+            sys.stdout.flush()
+            try:
+                written = os.writev(fd, vec)
+            except OSError:
+                # e.g. more lines than IOV_MAX; nothing was written, use the plain path
+                pass
+            else:
+                if written < sum(map(len, vec)):
+                    rest = b"".join(vec)[written:]
+                    while rest:
+                        rest = rest[os.write(fd, rest):]
+                return
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _parse_choice(text: str) -> int:
+    """Parse a menu choice; raises ValueError like int()."""
+    text = text.strip()
+    # Menu answers are almost always one digit: skip int()'s general parser
+    if len(text) == 1 and '0' <= text <= '9':
+        return ord(text) - 48
+    return int(text)
+
 
 def display_menu(username_manager: UsernameManager, settings_manager: SettingsManager) -> None:
     """Display the main menu."""
-    print("\nTikTok Live Watcher")
-    print("=" * 20)
-    print("1) Add a new username")
-    print("2) Remove existing username")
-    print("3) Show available usernames")
-
-    # Display recording status with color
+    # Display recording status with color; the whole menu goes out in one write
     recording_enabled = settings_manager.get_recording_enabled()
-    if recording_enabled:
-        status_text = "\033[32m\033[1mTrue\033[0m"  # Green bold
+    out = getattr(sys.stdout, 'buffer', None)
+    if out is not None and _MENU_BYTES is not None:
+        # Already encoded, so skip the text layer; flush it first to keep output in order
+        sys.stdout.flush()
+        out.write(_MENU_BYTES[bool(recording_enabled)])
     else:
-        status_text = "\033[31m\033[1mFalse\033[0m"  # Red bold
-
-    print(f"4) Record stream – {status_text}")
-    print("5) Check dependencies")
-    print("\n0) Exit")
+        sys.stdout.write(_MENU_HEAD + _STATUS[bool(recording_enabled)])
+    # No flush here: the choice prompt that always follows flushes
 
 
 def get_user_choice(max_choice: int) -> int:
     """Get validated user input."""
     while True:
         try:
-            choice = int(input(f"\nEnter choice (0-{max_choice}): "))
-            if 0 <= choice <= max_choice:
-                return choice
-            print(f"Please enter a number between 0 and {max_choice}")
-        except ValueError:
-            print("Please enter a valid number")
+            raw = _read_line(f"\nEnter choice (0-{max_choice}): ").strip()
         except (KeyboardInterrupt, EOFError):
             print("\nExiting...")
             return 0
 
+        # Validate up front instead of letting int() raise on bad input
+        if not raw.isdecimal():
+            print("Please enter a valid number")
+            continue
+        # More digits than max_choice is out of range anyway, and keeps huge
+        # input away from int()'s digit limit
+        if len(raw.lstrip("0")) <= len(str(max_choice)):
+            choice = _parse_choice(raw)
+            if 0 <= choice <= max_choice:
+                return choice
+        print(f"Please enter a number between 0 and {max_choice}")
+
 
 def add_username_flow(username_manager: UsernameManager) -> None:
     """Handle adding a new username."""
     while True:
         try:
-            print("\nAdd Username")
-            print("-" * 12)
-            print("1) Return to main menu")
-            username = input("Enter TikTok username (without @): ").strip()
+            # Header and prompt go out together
+            username = _read_line(_ADD_HEAD + "Enter TikTok username (without @): ").strip()
 
             if username == "1":
                 return
@@ -68,20 +215,22 @@ def add_username_flow(username_manager: UsernameManager) -> None:
 
 def remove_username_flow(username_manager: UsernameManager) -> None:
     """Handle removing an existing username."""
+    # Snapshot reused across re-prompts until the list actually changes
+    usernames, version = (), -1
     while True:
-        usernames = username_manager.get_usernames()
+        if version != username_manager.version:
+            usernames, version = username_manager.get_usernames(), username_manager.version
         if not usernames:
             print("No usernames to remove")
             return
 
-        print("\nRemove Username")
-        print("-" * 15)
-        print("1) Return to main menu")
-        for i, username in enumerate(usernames, 2):
-            print(f"{i}) {username}")
+        # Header and numbered list in one syscall
+        lines = list(_REMOVE_HEAD)
+        lines.extend(f"{i}) {username}" for i, username in enumerate(usernames, 2))
+        _write_lines(lines)
 
         try:
-            choice = int(input(f"\nEnter choice (1-{len(usernames) + 1}): "))
+            choice = _parse_choice(_read_line(f"\nEnter choice (1-{len(usernames) + 1}): "))
             if choice == 1:
                 return
             elif 2 <= choice <= len(usernames) + 1:
@@ -96,35 +245,41 @@ def remove_username_flow(username_manager: UsernameManager) -> None:
             return
 
 
-def select_username_flow(username_manager: UsernameManager) -> Optional[str]:
-    """Handle username selection submenu."""
+def select_usernames_flow(username_manager: UsernameManager) -> List[str]:
+    """Handle selecting one or more usernames to monitor together."""
+    # Snapshot reused across re-prompts until the list actually changes
+    usernames, version = (), -1
     while True:
-        usernames = username_manager.get_usernames()
+        if version != username_manager.version:
+            usernames, version = username_manager.get_usernames(), username_manager.version
         if not usernames:
             print("No usernames available. Add some usernames first.")
-            return None
+            return []
 
-        print("\nSelect Username to Monitor")
-        print("-" * 25)
-        print("1) Return to main menu")
-        for i, username in enumerate(usernames, 2):
-            if i > 9:  # Limit to options 2-9
-                break
-            print(f"{i}) {username}")
+        # Header, numbered list and the "all" option in one syscall
+        lines = list(_SELECT_MANY_HEAD)
+        lines.extend(f"{i}) {username}" for i, username in enumerate(usernames, 2))
+        lines.append("a) All usernames")
+        _write_lines(lines)
 
         try:
-            max_choice = min(len(usernames) + 1, 9)
-            choice = int(input(f"\nEnter choice (1-{max_choice}): "))
+            max_choice = len(usernames) + 1
+            raw = _read_line(f"\nEnter choices separated by commas (2-{max_choice}, a for all, 1 to return): ").strip().lower()
 
-            if choice == 1:
-                return None
-            elif 2 <= choice <= max_choice:
-                return usernames[choice - 2]
+            if raw == "a":
+                return list(usernames)
+
+            choices = [int(part) for part in raw.replace(",", " ").split()]
+            if choices == [1]:
+                return []
+            elif choices and all(2 <= choice <= max_choice for choice in choices):
+                # Keep input order, drop duplicates
+                return list(dict.fromkeys(usernames[choice - 2] for choice in choices))
             else:
                 print("Invalid choice")
         except (ValueError, KeyboardInterrupt, EOFError):
             print("Cancelled")
-            return None
+            return []
 
 
 def toggle_recording_flow(settings_manager: SettingsManager) -> None:
@@ -136,47 +291,27 @@ def toggle_recording_flow(settings_manager: SettingsManager) -> None:
 
 def check_dependencies_flow(interactive: bool = True) -> None:
     """Check and display dependency status."""
-    print("\n🔍 Checking Dependencies")
-    print("=" * 25)
-
-    recorder = StreamRecorder()
-    streamlink_available, ytdlp_available, ffmpeg_available = recorder.check_dependencies()
-
-    # Check streamlink
-    if streamlink_available:
-        print("✅ streamlink: Available")
-    else:
-        print("❌ streamlink: Not found")
-        print("   Install with: pip install streamlink")
+    while True:
+        # Cached after the first probe; "r" at the prompt below clears it
+        streamlink_available, ytdlp_available, ffmpeg_available = StreamRecorder.check_dependencies()
 
-    # Check yt-dlp
-    if ytdlp_available:
-        print("✅ yt-dlp: Available")
-    else:
-        print("⚠️  yt-dlp: Not found (optional fallback)")
-        print("   Install with: pip install yt-dlp")
+        # The whole report is collected and written once
+        parts = [
+            _DEPS_HEAD,
+            _STREAMLINK_HINT[streamlink_available],
+            _YTDLP_HINT[ytdlp_available],
+            _FFMPEG_HINT[ffmpeg_available],
+            "\n",
+            _DEPS_SUMMARY[streamlink_available, ffmpeg_available],
+        ]
+        sys.stdout.write("".join(parts))
 
-    # Check ffmpeg
-    if ffmpeg_available:
-        print("✅ ffmpeg: Available")
-    else:
-        print("❌ ffmpeg: Not found")
-        print("   Download from: https://ffmpeg.org/")
-
-    print()
-    if streamlink_available and ffmpeg_available:
-        print("🎉 All dependencies are installed!")
-        print("   Recording works + automatic video fixing")
-    elif streamlink_available and not ffmpeg_available:
-        print("✅ Recording will work!")
-        print("   But videos may have seeking/duration issues")
-        print("   Install ffmpeg for automatic video fixing")
-    elif not streamlink_available:
-        print("⚠️  Recording will NOT work - streamlink is missing")
-        print("   Run setup.bat again or install manually")
-
-    if interactive:
+        if not (interactive and _INTERACTIVE_TTY):
+            return
         try:
-            input("\nPress Enter to continue...")
+            answer = _read_line("\nPress Enter to continue (r to re-check)... ")
         except (EOFError, KeyboardInterrupt):
-            pass
\ No newline at end of file
+            return
+        if answer.strip().lower() != "r":
+            return
+        StreamRecorder.check_dependencies.cache_clear()